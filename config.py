@@ -12,13 +12,9 @@ import json
 from typing import List, Dict, Optional, Literal
 from dataclasses import dataclass
 from datetime import datetime
-from dotenv import load_dotenv
 import pytz
 from pathlib import Path
 
-# Load .env file
-load_dotenv()
-
 
 @dataclass
 class SelfConfig:
@@ -57,6 +53,7 @@ class WhatsAppConfig:
 class PollingConfig:
     """Message polling settings"""
     interval_seconds: int = 5
+    max_interval_seconds: int = 30
     max_concurrent_messages: int = 10
     processing_timeout_seconds: int = 300
     max_retries: int = 3
@@ -66,6 +63,8 @@ class PollingConfig:
         """Validate polling configuration"""
         if self.interval_seconds < 1 or self.interval_seconds > 300:
             raise ValueError("polling.interval_seconds must be between 1 and 300")
+        if self.max_interval_seconds < self.interval_seconds:
+            raise ValueError("polling.max_interval_seconds must be >= interval_seconds")
         if self.lookback_hours < 1 or self.lookback_hours > 168:
             raise ValueError("polling.lookback_hours must be between 1 and 168 (1 week)")
 
@@ -206,12 +205,29 @@ class VitalityConfig:
         self.get_timezone()
 
 
+@dataclass
+class SemanticCacheConfig:
+    """Response cache settings for repeated identical questions"""
+    enabled: bool = False
+    ttl_seconds: int = 300
+    max_entries: int = 256
+
+    def validate(self):
+        """Validate semantic cache configuration"""
+        if self.ttl_seconds < 1 or self.ttl_seconds > 86400:
+            raise ValueError("semantic_cache.ttl_seconds must be between 1 and 86400")
+        if self.max_entries < 1 or self.max_entries > 10000:
+            raise ValueError("semantic_cache.max_entries must be between 1 and 10000")
+
+
 @dataclass
 class PerplexityConfig:
     """Perplexity API settings"""
     model: str = "llama-3.1-sonar-large-128k-online"
     temperature: float = 0.7
     max_tokens: int = 500
+    max_concurrency: int = 4
+    stream: bool = False
 
     def validate(self):
         """Validate Perplexity configuration"""
@@ -219,15 +235,21 @@ class PerplexityConfig:
             raise ValueError("perplexity.temperature must be between 0.0 and 1.0")
         if self.max_tokens < 100 or self.max_tokens > 4000:
             raise ValueError("perplexity.max_tokens must be between 100 and 4000")
+        if self.max_concurrency < 1 or self.max_concurrency > 20:
+            raise ValueError("perplexity.max_concurrency must be between 1 and 20")
 
 
 class Config:
     """Main configuration class - singleton pattern"""
 
     def __init__(self, config_file: str = "app.json", env_file: str = ".env"):
-        # Load from .env
+        # Load from .env - imported here so merely importing config (e.g.
+        # for the dataclasses) doesn't pull dotenv at module load
+        from dotenv import load_dotenv
         if env_file != ".env":
             load_dotenv(env_file, override=True)
+        else:
+            load_dotenv()
         self.env_file = env_file
 
         self.perplexity_api_key = os.getenv("PERPLEXITY_API_KEY")
@@ -307,6 +329,9 @@ class Config:
         self.perplexity = PerplexityConfig(**data.get("perplexity", {}))
         self.perplexity.validate()
 
+        self.semantic_cache = SemanticCacheConfig(**data.get("semantic_cache", {}))
+        self.semantic_cache.validate()
+
         # Build lookup maps for fast access
         self._build_entity_maps()
 
@@ -15,6 +15,11 @@ from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Trigger literals pre-lowered into frozensets so the per-message check is
+# an O(1) hash lookup instead of a list scan
+_CONFIG_TRIGGERS = frozenset({"bot config", "bot-config", "bot_config"})
+_EXIT_COMMANDS = frozenset({"0", "exit"})
+
 
 class ConfigurationHandler:
     """Handles interactive configuration mode via WhatsApp"""
@@ -34,8 +39,7 @@ class ConfigurationHandler:
         if not message:
             return False
 
-        normalized = message.strip().lower()
-        return normalized in ["bot config", "bot-config", "bot_config"]
+        return message.strip().lower() in _CONFIG_TRIGGERS
 
     @staticmethod
     def is_exit_command(message: str) -> bool:
@@ -43,8 +47,7 @@ class ConfigurationHandler:
         if not message:
             return False
 
-        normalized = message.strip().lower()
-        return normalized in ["0", "exit"]
+        return message.strip().lower() in _EXIT_COMMANDS
 
     def get_session(self, chat_jid: str) -> Optional[Dict]:
         """Get existing config session for chat"""
@@ -272,6 +272,27 @@ class Database:
         self.conn.commit()
         return inserted
 
+    def insert_many(self, rows) -> int:
+        """
+        Batch-insert messages with a single commit (write-behind path).
+
+        Args:
+            rows: Iterable of (msg_id, chat_jid, sender, content,
+                  timestamp, is_from_me) tuples
+
+        Returns:
+            Number of newly inserted rows
+        """
+        cursor = self.conn.cursor()
+        cursor.executemany("""
+            INSERT OR IGNORE INTO messages
+            (id, chat_jid, sender, content, timestamp, is_from_me,
+             processing_status, synced_at)
+            VALUES (?, ?, ?, ?, ?, ?, 0, CURRENT_TIMESTAMP)
+        """, rows)
+        self.conn.commit()
+        return cursor.rowcount
+
     def get_unprocessed_messages(self, limit: int = 10) -> List[Dict]:
         """
         Get messages that haven't been processed by LLM agent yet.
@@ -324,9 +324,11 @@ async def run_service(args):
         # Store initial config hash
         try:
             cfg_path = Path(config.config_file)
-            cfg_hash = hashlib.sha256(cfg_path.read_bytes()).hexdigest()
-            db.set_config_hash(cfg_hash)
-            logger.info(f"Config hash recorded: {cfg_hash[:8]}...")
+            digest = hashlib.sha256(cfg_path.read_bytes())
+            db.set_config_hash(digest.hexdigest())
+            # Hex-encode only the first 4 raw bytes for the log line instead of
+            # slicing the full 64-char hex string.
+            logger.info(f"Config hash recorded: {digest.digest()[:4].hex()}...")
         except Exception as e:
             logger.warning(f"Could not record config hash: {e}")
 
@@ -405,9 +407,9 @@ async def run_service(args):
         # Cleanup
         logger.info("\nShutting down...")
         if message_agent:
-            message_agent.stop()
+            await message_agent.stop()
         vitality_checker.stop()
-        whatsapp.disconnect()
+        await whatsapp.disconnect()
 
         # Cancel all tasks
         for task in tasks:
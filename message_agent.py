@@ -6,7 +6,15 @@ and session memory, then sends responses back via WhatsApp.
 """
 
 import asyncio
+import bisect
+import functools
+import json
 import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import List, Dict, Optional
 import httpx
 from datetime import datetime, timedelta, timezone
@@ -17,10 +25,56 @@ from config import reload_config
 
 logger = logging.getLogger(__name__)
 
+# Wake-word prefixes compiled once so the per-message check is a single
+# C-level scan instead of six Python startswith calls. The pattern is
+# case-sensitive and matched against input lowered once - faster than an
+# IGNORECASE alternation, which re-folds case at every branch.
+# English: "hello bot", "hey bot", "hi bot" (case-insensitive via .lower())
+# Hebrew: "הלו בוט", "היי בוט", "הי בוט" have no case
+_WAKE_WORD_RE = re.compile(
+    r"^(?:hello bot|hey bot|hi bot|הלו בוט|היי בוט|הי בוט)\s*"
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_prompt_cached(path: str, mtime_ns: int) -> str:
+    """Read a prompt file, memoized on (path, mtime) so edits invalidate naturally"""
+    return Path(path).read_text(encoding="utf-8")
+
+
+# Sender-format hint appended to the system prompt. Module-level constant so
+# the prompt prefix stays byte-identical across turns and provider-side prefix
+# caching can kick in.
+_SENDER_NOTE = (
+    "\n\nNote: Messages include sender information in the format "
+    "'[From: phone_number]' or '[Message from: phone_number]'. Use this to "
+    "personalize responses and refer to specific people appropriately."
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _system_message(prompt: str) -> Dict[str, str]:
+    """Compose the system message once per distinct prompt (never mutated)"""
+    return {"role": "system", "content": f"{prompt}{_SENDER_NOTE}"}
+
+
+def format_user_message(message: str, sender: str = None) -> str:
+    """Format the current user message with sender context for the LLM"""
+    # No-sender is the common path - return the message untouched
+    return message if sender is None else f"[Message from: {sender}]\n{message}"
+
+
+def format_context_entry(message: str, sender: str = None) -> str:
+    """Format a stored context entry with sender context"""
+    return message if sender is None else f"[From: {sender}] {message}"
+
 
 class PerplexityClient:
     """Client for Perplexity API"""
 
+    __slots__ = ('api_key', 'model', 'temperature', 'max_tokens',
+                 'base_url', '_client')
+
     def __init__(self, api_key: str, model: str, temperature: float, max_tokens: int):
         """
         Initialize Perplexity client
@@ -37,6 +91,28 @@ class PerplexityClient:
         self.max_tokens = max_tokens
         self.base_url = "https://api.perplexity.ai"
 
+        # Long-lived client so repeated calls reuse the pooled HTTPS connection
+        # instead of paying a TCP + TLS handshake per request
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            }
+        )
+
+    async def aclose(self):
+        """Close the underlying HTTP connection pool"""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
     async def chat_completion(self, messages: List[Dict[str, str]]) -> str:
         """
         Call Perplexity chat completion API
@@ -50,12 +126,6 @@ class PerplexityClient:
         Raises:
             Exception: If API call fails
         """
-        url = f"{self.base_url}/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-
         payload = {
             "model": self.model,
             "messages": messages,
@@ -64,12 +134,11 @@ class PerplexityClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(url, json=payload, headers=headers)
-                response.raise_for_status()
+            response = await self._client.post("/chat/completions", json=payload)
+            response.raise_for_status()
 
-                data = response.json()
-                return data["choices"][0]["message"]["content"]
+            data = response.json()
+            return data["choices"][0]["message"]["content"]
 
         except httpx.HTTPStatusError as e:
             logger.error(f"Perplexity API error: {e.response.status_code} - {e.response.text}")
@@ -80,6 +149,114 @@ class PerplexityClient:
             logger.error(f"Error calling Perplexity API: {e}", exc_info=True)
             raise
 
+    async def chat_completion_stream(self, messages: List[Dict[str, str]]):
+        """
+        Stream a chat completion via SSE, yielding content deltas as they arrive.
+
+        Lets the caller start consuming output at time-to-first-token instead
+        of waiting for the full body.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+
+        Yields:
+            Incremental response text chunks
+
+        Raises:
+            Exception: If API call fails
+        """
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "stream": True
+        }
+
+        try:
+            async with self._client.stream("POST", "/chat/completions", json=payload) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    logger.error(f"Perplexity API error: {response.status_code} - {response.text}")
+                    raise Exception(f"Perplexity API returned {response.status_code}")
+
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    data_text = line[len("data: "):].strip()
+                    if data_text == "[DONE]":
+                        break
+                    try:
+                        delta = json.loads(data_text)["choices"][0]["delta"].get("content")
+                    except (KeyError, IndexError, ValueError):
+                        continue
+                    if delta:
+                        yield delta
+
+        except Exception as e:
+            logger.error(f"Error streaming from Perplexity API: {e}", exc_info=True)
+            raise
+
+
+@dataclass
+class ResolvedEntity:
+    """
+    Flattened per-chat config snapshot built once at config (re)load.
+
+    Collapses the per-message getattr chains into a single dict lookup on
+    the hot path. The prompt stays unresolved here: file-backed prompts are
+    read per message through the mtime-keyed cache so edits to a prompt
+    file are picked up without an app.json change.
+    """
+    prompt_value: str
+    prompt_is_file: bool
+    persona: str
+    debug: bool
+    hey_bot: bool
+    session_memory: object  # SessionMemoryConfig
+    response_delay: int
+
+
+class ResponseCache:
+    """
+    TTL-bounded cache of LLM responses keyed by (prompt hash, chat JID,
+    normalized message).
+
+    Lightweight stand-in for a semantic cache: repeated identical questions
+    (e.g. "what time is it") skip the Perplexity round-trip entirely while
+    the entry is fresh. Keying on the chat keeps personalized replies (sender
+    tags, per-chat history) from leaking between conversations. Entries are
+    evicted lazily on lookup and oldest-first when the cache is full.
+    """
+
+    def __init__(self, ttl_seconds: int = 300, max_entries: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[tuple, tuple] = {}  # key -> (response, stored_at)
+
+    @staticmethod
+    def _make_key(prompt_sha: str, chat_jid: str, message: str) -> tuple:
+        return (prompt_sha, chat_jid, message.strip().casefold())
+
+    def get(self, prompt_sha: str, chat_jid: str, message: str) -> Optional[str]:
+        """Return cached response if present and not expired"""
+        key = self._make_key(prompt_sha, chat_jid, message)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        response, stored_at = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        return response
+
+    def put(self, prompt_sha: str, chat_jid: str, message: str, response: str):
+        """Store a response, evicting the oldest entry when full"""
+        if len(self._entries) >= self.max_entries:
+            oldest_key = min(self._entries, key=lambda k: self._entries[k][1])
+            del self._entries[oldest_key]
+        self._entries[self._make_key(prompt_sha, chat_jid, message)] = (response, time.monotonic())
+
 
 class MessageAgent:
     """AI response agent"""
@@ -97,6 +274,9 @@ class MessageAgent:
         self.db = database
         self.whatsapp = whatsapp_client
 
+        # Cache the self JID - consulted several times per message
+        self._self_jid = config.get_self_jid()
+
         # Initialize Perplexity client
         self.perplexity = PerplexityClient(
             api_key=config.perplexity_api_key,
@@ -105,14 +285,21 @@ class MessageAgent:
             max_tokens=config.perplexity.max_tokens
         )
 
+        # Optional response cache (skips Perplexity calls for repeated questions)
+        self.response_cache = self._build_response_cache(config)
+
         self.is_running = False
         # For self-debug chats, drop stale sessions older than this to avoid pulling
         # historical context into a new debug exchange.
         self.self_session_stale_seconds = getattr(config.self, "stale_session_seconds", 60)
-        # Track last bot responses per chat to avoid re-processing our own replies
-        self.last_bot_response = {}
-        # Track current config hash
+        # Track a short digest of the last bot response per chat to avoid
+        # re-processing our own replies; LRU-bounded so long-running bots
+        # don't retain every chat (or full response texts) forever
+        self.last_bot_response: OrderedDict = OrderedDict()
+        self._last_bot_cap = 1024
+        # Track current config hash and file stat (mtime/size fast-path)
         self.config_hash = None
+        self._config_stat = None
         self._init_config_hash()
         # Limit the amount of history we send to the model to prevent runaway prompts
         self.max_context_messages = 20
@@ -120,6 +307,43 @@ class MessageAgent:
         self.response_delay_default = getattr(config, "response_delay_default", 5)
         # Lock to prevent concurrent polling cycles
         self._processing_lock = asyncio.Lock()
+        # Consecutive empty polling cycles - drives exponential back-off when idle
+        self._idle_cycles = 0
+        # Cap concurrent Perplexity calls to respect provider rate limits
+        self._llm_semaphore = asyncio.Semaphore(
+            getattr(config.perplexity, "max_concurrency", 4)
+        )
+        # In-flight debug-info sends (kept referenced so tasks aren't GC'd mid-flight)
+        self._debug_tasks: set = set()
+        # Flattened per-chat config records (rebuilt on config reload)
+        self._resolved_entities = self._build_resolved_entities(config)
+
+    @staticmethod
+    def _build_response_cache(config) -> Optional[ResponseCache]:
+        """Create a ResponseCache when enabled in config, else None"""
+        cache_config = getattr(config, "semantic_cache", None)
+        if cache_config and cache_config.enabled:
+            return ResponseCache(
+                ttl_seconds=cache_config.ttl_seconds,
+                max_entries=cache_config.max_entries
+            )
+        return None
+
+    @staticmethod
+    def _on_debug_send_done(msg_id: str, task):
+        """
+        Done callback for background debug-info sends.
+
+        Retrieves the task's exception so a failed send never surfaces as
+        "Task exception was never retrieved" noise, and logs the outcome.
+        """
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.error(f"❌ Failed to send debug info for {msg_id}: {exc}", exc_info=exc)
+        else:
+            logger.info(f"✅ Successfully sent debug info for message {msg_id}")
 
     @staticmethod
     def check_and_strip_wake_word(content: str) -> tuple:
@@ -153,48 +377,55 @@ class MessageAgent:
         if not content or not isinstance(content, str):
             return False, content
 
-        # Normalize: strip whitespace, lowercase for English
         normalized = content.strip()
-        normalized_lower = normalized.lower()
-
-        # English wake word variations
-        english_wake_words = [
-            ("hello bot", 9),  # (pattern, length)
-            ("hey bot", 7),
-            ("hi bot", 6),
-        ]
-
-        for wake_word, length in english_wake_words:
-            if normalized_lower.startswith(wake_word):
-                # Strip wake word and any following whitespace
-                stripped = normalized[length:].lstrip()
-                return True, stripped
-
-        # Hebrew wake word variations
-        hebrew_wake_words = [
-            ("הלו בוט", 7),    # "hello bot" in Hebrew
-            ("היי בוט", 7),    # "hey bot" in Hebrew (with extra yod)
-            ("הי בוט", 6),     # "hi bot" in Hebrew
-        ]
-
-        for wake_word, length in hebrew_wake_words:
-            if normalized.startswith(wake_word):
-                # Strip wake word and any following whitespace
-                stripped = normalized[length:].lstrip()
-                return True, stripped
+        # Shortest wake word ("hi bot" / "הי בוט") is 6 chars - shorter
+        # messages cannot match, so skip the casefold copy entirely
+        if len(normalized) < 6:
+            return False, content
+
+        # Fold only a bounded prefix (longest wake word is 9 chars) so long
+        # group-chat messages never pay for a full lowercased copy; the wake
+        # words are ASCII/Hebrew so casefold preserves offsets
+        match = _WAKE_WORD_RE.match(normalized[:16].casefold())
+        if match:
+            # The regex consumed the wake word plus whitespace within the
+            # prefix window; lstrip covers whitespace running past it
+            return True, normalized[match.end():].lstrip()
 
         return False, content
 
+    def _build_resolved_entities(self, config) -> Dict[str, ResolvedEntity]:
+        """Flatten active entity configs for hot-path lookup"""
+        resolved = {}
+        for entity in config.monitored_entities:
+            if not entity.active:
+                continue
+            jid = entity.get_identifier()
+            resolved[jid] = ResolvedEntity(
+                prompt_value=entity.prompt,
+                prompt_is_file=getattr(entity, "prompt_is_file", False),
+                persona=entity.persona,
+                debug=getattr(entity, "debug", False),
+                hey_bot=getattr(entity, "hey_bot", False),
+                session_memory=config.get_session_memory_for_entity(jid),
+                response_delay=config.get_response_delay_for_entity(jid)
+            )
+        return resolved
+
     def _resolve_prompt(self, prompt_value: str, prompt_is_file: bool = False) -> str:
         """Load prompt text, supporting file paths when requested or auto-detected."""
-        from pathlib import Path
-
-        if prompt_is_file or ("/" in prompt_value and Path(prompt_value).exists()):
-            path = Path(prompt_value)
+        if prompt_is_file or "/" in prompt_value:
+            # One stat covers both the existence check and cache invalidation
+            try:
+                st = os.stat(prompt_value)
+            except OSError as e:
+                if prompt_is_file:
+                    logger.warning(f"Failed to read prompt file {prompt_value}: {e}")
+                return prompt_value
             try:
-                return path.read_text(encoding="utf-8")
+                return _read_prompt_cached(prompt_value, st.st_mtime_ns)
             except Exception as e:
-                logger.warning(f"Failed to read prompt file {path}: {e}")
+                logger.warning(f"Failed to read prompt file {prompt_value}: {e}")
                 return prompt_value
 
         return prompt_value
@@ -209,35 +440,57 @@ class MessageAgent:
             logger.warning(f"Unable to hash config file {getattr(self.config, 'config_file', 'app.json')}: {e}")
             return None
 
+    def _stat_config_file(self) -> Optional[tuple]:
+        """Return (mtime_ns, size) of the config file, or None if unreadable"""
+        try:
+            st = os.stat(self.config.config_file)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
     def _maybe_reload_config(self):
         """Reload configuration if app.json hash changed."""
+        # Fast-path: skip the file read + SHA-256 + DB round-trip entirely
+        # when the file's mtime/size are unchanged since the last check
+        stat_key = self._stat_config_file()
+        if stat_key is not None and stat_key == self._config_stat:
+            return
+
         current_hash = self._hash_config_file()
         if not current_hash:
             return
 
-        stored_hash = None
-        try:
-            stored_hash = self.db.get_config_hash()
-        except Exception:
-            logger.warning("Could not read config hash from DB", exc_info=True)
-
-        if stored_hash == current_hash and self.config_hash == current_hash:
-            return  # no change
+        if current_hash == self.config_hash:
+            # Touched but content unchanged - remember the new stat
+            self._config_stat = stat_key
+            return
 
         logger.info("Detected config change, reloading configuration...")
         try:
             new_config = reload_config(self.config.config_file, getattr(self.config, "env_file", ".env"))
             self.config = new_config
-            # Rebuild Perplexity client with new settings
+            self._self_jid = new_config.get_self_jid()
+            # Rebuild Perplexity client with new settings (close old pool in background)
+            old_perplexity = self.perplexity
+            try:
+                asyncio.get_running_loop().create_task(old_perplexity.aclose())
+            except RuntimeError:
+                pass  # No running loop (e.g. tests) - pool is GC'd
             self.perplexity = PerplexityClient(
                 api_key=new_config.perplexity_api_key,
                 model=new_config.perplexity.model,
                 temperature=new_config.perplexity.temperature,
                 max_tokens=new_config.perplexity.max_tokens
             )
+            self.response_cache = self._build_response_cache(new_config)
+            self._resolved_entities = self._build_resolved_entities(new_config)
+            self._llm_semaphore = asyncio.Semaphore(
+                getattr(new_config.perplexity, "max_concurrency", 4)
+            )
             self.self_session_stale_seconds = getattr(new_config.self, "stale_session_seconds", 60)
             self.response_delay_default = getattr(new_config, "response_delay_default", 5)
             self.config_hash = current_hash
+            self._config_stat = stat_key
             self.db.set_config_hash(current_hash)
             logger.info("✅ Config reloaded successfully")
             # Surface a clear notice to main stdout that app.json was refreshed.
@@ -255,6 +508,7 @@ class MessageAgent:
             if stored_hash != current_hash:
                 self.db.set_config_hash(current_hash)
             self.config_hash = current_hash
+            self._config_stat = self._stat_config_file()
         except Exception:
             logger.warning("Could not initialize config hash in DB", exc_info=True)
 
@@ -262,19 +516,47 @@ class MessageAgent:
         """Convert timestamps from DB into timezone-aware UTC datetimes."""
         if isinstance(value, datetime):
             dt = value
+        elif value is None:
+            return datetime.now(timezone.utc)
         else:
             try:
-                dt = datetime.fromisoformat(str(value))
-            except Exception:
-                dt = datetime.utcnow()
+                dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+            except (ValueError, TypeError):
+                return datetime.now(timezone.utc)
+        # Common case: naive UTC string from SQLite - tag it without the
+        # astimezone round-trip; only genuinely offset-aware values convert
         if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
+            return dt.replace(tzinfo=timezone.utc)
+        if dt.tzinfo is timezone.utc:
+            return dt
         return dt.astimezone(timezone.utc)
 
     def _get_session_memory_config(self, chat_jid: str):
         """Return the session memory config for the target chat."""
         return self.config.get_session_memory_for_entity(chat_jid)
 
+    @staticmethod
+    def _entry_epoch(entry: Dict) -> Optional[float]:
+        """
+        Get an entry's timestamp as epoch seconds.
+
+        New entries carry a precomputed 'ts' float; older persisted entries
+        only have the ISO 'timestamp' string and fall back to parsing.
+        """
+        epoch = entry.get("ts")
+        if epoch is not None:
+            return epoch
+        ts_text = entry.get("timestamp")
+        if not ts_text:
+            return None
+        try:
+            dt = datetime.fromisoformat(ts_text)
+        except Exception:
+            return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+
     def _prune_context(self, context: List[Dict], session_memory_config, now: datetime) -> List[Dict]:
         """
         Trim context based on session window (duration mode) and hard message count limit.
@@ -283,26 +565,31 @@ class MessageAgent:
         if not context:
             return []
 
-        pruned = []
-        cutoff = None
+        cutoff_ts = None
         if session_memory_config.reset_mode == "duration":
             duration_minutes = session_memory_config.get_duration_minutes()
             if duration_minutes:
-                cutoff = now - timedelta(minutes=duration_minutes)
+                cutoff_ts = (now - timedelta(minutes=duration_minutes)).timestamp()
 
-        for entry in context:
-            if cutoff is None:
-                pruned.append(entry)
-                continue
-            ts_text = entry.get("timestamp")
-            try:
-                ts = datetime.fromisoformat(ts_text) if ts_text else None
-            except Exception:
-                ts = None
-            if ts and ts.tzinfo is None:
-                ts = ts.replace(tzinfo=timezone.utc)
-            if ts is None or ts >= cutoff:
-                pruned.append(entry)
+        if cutoff_ts is None:
+            pruned = context
+        else:
+            epochs = [self._entry_epoch(entry) for entry in context]
+            if None in epochs:
+                # Legacy entries without a parseable timestamp are always
+                # kept; they also break bisect's sorted precondition, so
+                # fall back to a linear scan for this (rare) shape
+                pruned = [
+                    entry for entry, epoch in zip(context, epochs)
+                    if epoch is None or epoch >= cutoff_ts
+                ]
+            else:
+                # Context is append-only, oldest->newest, so the first
+                # in-window entry can be found by binary search (plain
+                # bisect over the epoch list - the key= form needs 3.10
+                # and this repo supports 3.9)
+                start = bisect.bisect_left(epochs, cutoff_ts)
+                pruned = context[start:] if start else context
 
         # Keep only the most recent slice to avoid giant prompts
         if len(pruned) > self.max_context_messages:
@@ -311,7 +598,7 @@ class MessageAgent:
         return pruned
 
     def _format_context_for_prompt(self, context: List[Dict]) -> str:
-        """Render context as readable lines for debug/system prompt."""
+        """Render context as readable lines for the debug dump."""
         lines = []
         for entry in context:
             role = entry.get("role", "user").upper()
@@ -325,38 +612,80 @@ class MessageAgent:
                 lines.append(f"{role}: {content}")
         return "\n".join(lines)
 
-    def _augment_prompt_with_context(self, prompt: str, context_text: str) -> str:
-        """Append context summary to the system prompt."""
-        if not context_text:
-            return prompt
+    def _build_llm_messages(self, prompt: str, context: List[Dict], user_message: str) -> List[Dict]:
+        """
+        Build the messages array for the API with a stable prefix.
 
-        sender_note = "\nNote: Messages include sender information in the format '[From: phone_number]' or '[Message from: phone_number]'. Use this to personalize responses and refer to specific people appropriately."
-        return f"{prompt}\n\nConversation context (most recent first):\n{context_text}{sender_note}"
+        The system prompt is kept byte-identical across turns (no per-turn
+        context injection) and history is emitted as real user/assistant
+        turns, oldest first, so providers with prefix caching only pay for
+        the static persona once per chat.
+        """
+        messages = [_system_message(prompt)]
+        for entry in context:
+            entry_content = entry.get("content", "")
+            if not entry_content:
+                continue
+            # Providers reject unknown fields like 'timestamp' - send role/content only
+            messages.append({
+                "role": entry.get("role", "user"),
+                "content": entry_content
+            })
+        messages.append({"role": "user", "content": user_message})
+        return messages
+
+    def _remember_bot_response(self, chat_jid: str, response: str):
+        """Record a 16-byte BLAKE2b digest of the last response sent to a chat"""
+        digest = hashlib.blake2b(response.encode(), digest_size=16).digest()
+        self.last_bot_response[chat_jid] = digest
+        self.last_bot_response.move_to_end(chat_jid)
+        if len(self.last_bot_response) > self._last_bot_cap:
+            self.last_bot_response.popitem(last=False)
+
+    def _matches_last_bot_response(self, chat_jid: str, content: str) -> bool:
+        """Check whether content equals the last response sent to this chat"""
+        digest = self.last_bot_response.get(chat_jid)
+        if digest is None:
+            return False
+        return hashlib.blake2b(content.encode(), digest_size=16).digest() == digest
+
+    def _is_self(self, chat_jid: str) -> bool:
+        """Check against the cached self JID (hot-path is_self_message)"""
+        return chat_jid == self._self_jid
 
     async def _maybe_wait_for_user_response(self, chat_jid: str, sender: str,
                                             message_time: datetime, delay_seconds: int) -> bool:
         """
         Wait for a user response before proceeding to the LLM.
         Returns True if we should proceed with LLM, False if user responded in time.
+
+        Polls the DB once per second: inserts can land from outside the
+        polling cycle (client callbacks, write-behind), and the cycle lock
+        held around this wait means no in-process event could ever be
+        signalled concurrently - the DB is the only authoritative source.
         """
         if delay_seconds <= 0:
             return True
 
-        deadline = datetime.now(timezone.utc) + timedelta(seconds=delay_seconds)
-        check_interval = min(1, delay_seconds)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + delay_seconds
 
-        while datetime.now(timezone.utc) < deadline:
-            # If a new unprocessed incoming message arrives after the original timestamp,
-            # treat it as the user taking over and skip LLM response.
+        while True:
+            # If a new unprocessed incoming message arrived after the
+            # original timestamp, treat it as the user taking over and
+            # skip the LLM. The final iteration runs after the full delay,
+            # so late replies still suppress the bot.
             try:
                 if self.db.has_unprocessed_message_after(chat_jid, message_time, sender):
                     return False
             except Exception:
                 logger.warning("Failed to check for follow-up message", exc_info=True)
-                break
-            await asyncio.sleep(check_interval)
+                return True
 
-        return True
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return True
+            await asyncio.sleep(min(1.0, remaining))
 
     def _append_and_trim_context(self, context: List[Dict], user_message: str,
                                  assistant_message: str, user_time: datetime,
@@ -371,19 +700,21 @@ class MessageAgent:
         updated = list(context)
 
         # Include sender information in user message if available
-        user_content = user_message
-        if sender:
-            user_content = f"[From: {sender}] {user_message}"
+        user_content = format_context_entry(user_message, sender)
 
+        # 'ts' is the epoch-seconds form used for pruning; the ISO 'timestamp'
+        # is kept for human-readable debug output
         updated.append({
             "role": "user",
             "content": user_content,
-            "timestamp": user_time.isoformat()
+            "timestamp": user_time.isoformat(),
+            "ts": user_time.timestamp()
         })
         updated.append({
             "role": "assistant",
             "content": assistant_message,
-            "timestamp": response_time.isoformat()
+            "timestamp": response_time.isoformat(),
+            "ts": response_time.timestamp()
         })
         return self._prune_context(updated, session_memory_config, response_time)
 
@@ -394,16 +725,25 @@ class MessageAgent:
 
         while self.is_running:
             try:
-                await asyncio.sleep(self.config.polling.interval_seconds)
+                # Back off exponentially while idle so an inactive chat costs
+                # ~1 cycle per max_interval_seconds instead of per interval
+                interval = min(
+                    getattr(self.config.polling, "max_interval_seconds", 30),
+                    self.config.polling.interval_seconds * (2 ** self._idle_cycles)
+                )
+                await asyncio.sleep(interval)
                 await self.process_new_messages()
 
             except Exception as e:
                 logger.error(f"Error in message agent loop: {e}", exc_info=True)
                 await asyncio.sleep(5)  # Wait before retrying
 
-    def stop(self):
-        """Stop the message polling loop"""
+    async def stop(self):
+        """Stop the message polling loop and close the LLM connection pool"""
         self.is_running = False
+        # Awaited here: a fire-and-forget task created this late in
+        # shutdown would be destroyed before it runs
+        await self.perplexity.aclose()
         logger.info("Message agent stopped")
 
     async def process_new_messages(self):
@@ -421,7 +761,7 @@ class MessageAgent:
                 # Sync from Go bridge
                 monitored_jids = [e.get_identifier() for e in self.config.monitored_entities if e.active]
                 if self.config.self.active:
-                    monitored_jids.append(self.config.get_self_jid())
+                    monitored_jids.append(self._self_jid)
 
                 synced_count = self.db.sync_from_go_bridge(
                     monitored_jids=monitored_jids,
@@ -435,21 +775,40 @@ class MessageAgent:
                 messages = self.db.fetch_and_lock_messages(limit=10, timeout_seconds=300)
 
                 if not messages:
+                    self._idle_cycles = min(self._idle_cycles + 1, 5)
                     return
 
+                self._idle_cycles = 0
+
                 logger.info(f"Processing {len(messages)} new messages...")
 
+                # Group by chat: different chats run concurrently (each waits
+                # on its own LLM round-trip), while messages within a chat
+                # stay strictly ordered
+                chats: Dict[str, List[Dict]] = {}
                 for msg in messages:
-                    try:
-                        await self.process_message(msg)
-                        self.db.mark_message_completed(msg["id"])
-                    except Exception as e:
-                        logger.error(f"Failed to process {msg['id']}: {e}", exc_info=True)
-                        self.db.mark_message_failed(msg["id"], max_retries=3)
+                    chats.setdefault(msg["chat_jid"], []).append(msg)
+
+                await asyncio.gather(
+                    *(self._process_chat_messages(chat_msgs) for chat_msgs in chats.values()),
+                    return_exceptions=True
+                )
 
             except Exception as e:
                 logger.error(f"Error in polling cycle: {e}", exc_info=True)
 
+    async def _process_chat_messages(self, messages: List[Dict]):
+        """Process a single chat's messages serially to preserve ordering"""
+        for msg in messages:
+            try:
+                await self.process_message(msg)
+                self.db.mark_message_completed(msg["id"])
+            except Exception:
+                # Single log site per failed message - process_message no
+                # longer formats the traceback before re-raising
+                logger.exception(f"Failed to process {msg['id']}")
+                self.db.mark_message_failed(msg["id"], max_retries=3)
+
     async def process_message(self, message: Dict):
         """
         Process a single message
@@ -457,293 +816,322 @@ class MessageAgent:
         Args:
             message: Message dict from database
         """
-        try:
-            msg_id = message["id"]
-
-            # IDEMPOTENCY CHECK
-            cursor = self.db.conn.cursor()
-            cursor.execute("SELECT processing_status FROM messages WHERE id = ?", (msg_id,))
-            row = cursor.fetchone()
-            if row and row[0] == 2:
-                logger.info(f"Message {msg_id} already completed, skipping")
-                return
+        msg_id = message["id"]
 
-            chat_jid = message["chat_jid"]
-            sender = message["sender"]
-            content = message["content"]
-            is_from_me = message.get("is_from_me", False)
+        # IDEMPOTENCY CHECK - fetch_and_lock_messages only returns fresh or
+        # timed-out rows, so checking the already-fetched row replaces the
+        # per-message SELECT round-trip
+        if message.get("processing_status") == 2:
+            logger.info(f"Message {msg_id} already completed, skipping")
+            return
 
-            # Show first 50 chars of message for visibility
-            content_preview = content[:50] + "..." if len(content) > 50 else content
-            logger.info(f"Processing message {msg_id} from {chat_jid}: '{content_preview}'")
+        chat_jid = message["chat_jid"]
+        sender = message["sender"]
+        content = message["content"]
+        is_from_me = message.get("is_from_me", False)
 
-            # Determine if message is from the bot itself
-            self_jid = self.config.get_self_jid()
-            from_bot = msg_id.startswith("sent_") or sender == self_jid or sender.endswith(self_jid)
+        # Show first 50 chars of message for visibility
+        content_preview = content[:50] + "..." if len(content) > 50 else content
+        logger.info(f"Processing message {msg_id} from {chat_jid}: '{content_preview}'")
 
-            # Skip bot-originated messages entirely (prevents ack/loops)
-            if from_bot:
-                logger.info(f"Skipping bot-originated message {msg_id}")
-                # Marking handled by caller
-                return
+        # Determine if message is from the bot itself
+        self_jid = self._self_jid
+        from_bot = msg_id.startswith("sent_") or sender == self_jid or sender.endswith(self_jid)
 
-            # Check for config changes before processing
-            self._maybe_reload_config()
+        # Skip bot-originated messages entirely (prevents ack/loops)
+        if from_bot:
+            logger.info(f"Skipping bot-originated message {msg_id}")
+            # Marking handled by caller
+            return
 
-            # === CONFIGURATION MODE CHECK (SELF GROUP ONLY) ===
-            if self.config.is_self_message(chat_jid):
-                from config_handler import ConfigurationHandler
-                config_handler = ConfigurationHandler(self.db)
+        # === CONFIGURATION MODE CHECK (SELF GROUP ONLY) ===
+        if self._is_self(chat_jid):
+            from config_handler import ConfigurationHandler
+            config_handler = ConfigurationHandler(self.db)
+
+            # Check if entering config mode
+            if config_handler.is_config_trigger(content):
+                response = config_handler.handle_config_trigger(self.config)
+                config_handler.create_session(chat_jid, "list")
+                await self.whatsapp.send_message(chat_jid, response)
+                self.db.mark_message_completed(msg_id)
+                return
 
-                # Check if entering config mode
-                if config_handler.is_config_trigger(content):
-                    response = config_handler.handle_config_trigger(self.config)
-                    config_handler.create_session(chat_jid, "list")
-                    await self.whatsapp.send_message(chat_jid, response)
+            # Check if in config mode
+            session = config_handler.get_session(chat_jid)
+            if session:
+                # Check for exit command
+                if config_handler.is_exit_command(content):
+                    config_handler.clear_session(chat_jid)
+                    await self.whatsapp.send_message(chat_jid, "Configuration mode exited.")
                     self.db.mark_message_completed(msg_id)
                     return
 
-                # Check if in config mode
-                session = config_handler.get_session(chat_jid)
-                if session:
-                    # Check for exit command
-                    if config_handler.is_exit_command(content):
-                        config_handler.clear_session(chat_jid)
-                        await self.whatsapp.send_message(chat_jid, "Configuration mode exited.")
-                        self.db.mark_message_completed(msg_id)
-                        return
-
-                    # Route to config handler
-                    response = config_handler.handle_message(content, self.config, session)
-                    await self.whatsapp.send_message(chat_jid, response)
-                    self.db.mark_message_completed(msg_id)
+                # Route to config handler
+                response = config_handler.handle_message(content, self.config, session)
+                await self.whatsapp.send_message(chat_jid, response)
+                self.db.mark_message_completed(msg_id)
 
-                    # Reload config if it was updated
-                    if "Configuration updated successfully" in response:
-                        logger.info("Config updated via WhatsApp - reloading config")
-                        self.config = reload_config(self.config.config_file)
+                # Reload config if it was updated
+                if "Configuration updated successfully" in response:
+                    logger.info("Config updated via WhatsApp - reloading config")
+                    self.config = reload_config(self.config.config_file)
+                    self._self_jid = self.config.get_self_jid()
+                    self._resolved_entities = self._build_resolved_entities(self.config)
 
-                    return
+                return
 
-            # Use consistent session user ID
-            if self.config.is_self_message(chat_jid):
-                session_user = self.config.get_self_jid()
-            else:
-                session_user = sender
-
-            # Avoid feedback loops: if this message matches the last response we sent to this chat,
-            # skip it (it's our own previous reply surfacing from the bridge).
-            if not self.config.is_self_message(chat_jid):
-                last_response = self.last_bot_response.get(chat_jid)
-                if is_from_me and last_response and content == last_response:
-                    logger.info(f"Skipping bot-sent echo {msg_id} in {chat_jid}")
-                    # Marking handled by caller
-                    return
+        # Use consistent session user ID
+        if self._is_self(chat_jid):
+            session_user = self._self_jid
+        else:
+            session_user = sender
 
-            # Check if this is a message to yourself
-            if self.config.is_self_message(chat_jid):
-                if not self.config.self.active:
-                    logger.info(f"Self messages disabled, skipping {msg_id}")
-                    # Marking handled by caller
-                    return
+        # Avoid feedback loops: if this message matches the last response we sent to this chat,
+        # skip it (it's our own previous reply surfacing from the bridge).
+        if not self._is_self(chat_jid):
+            if is_from_me and self._matches_last_bot_response(chat_jid, content):
+                logger.info(f"Skipping bot-sent echo {msg_id} in {chat_jid}")
+                # Marking handled by caller
+                return
 
-                # IMPORTANT: For self-messages, both user and bot messages have is_from_me=1
-                # We identify bot responses by their message ID pattern (starts with "sent_")
-                if msg_id.startswith("sent_"):
-                    logger.info(f"Skipping bot-sent self message {msg_id}")
-                    # Marking handled by caller
-                    return
+        # Check if this is a message to yourself
+        if self._is_self(chat_jid):
+            if not self.config.self.active:
+                logger.info(f"Self messages disabled, skipping {msg_id}")
+                # Marking handled by caller
+                return
 
-                # Use self configuration
-                prompt = self._resolve_prompt(
-                    prompt_value=self.config.self.prompt,
-                    prompt_is_file=getattr(self.config.self, "prompt_is_file", False)
-                )
-                persona = self.config.self.persona
-                debug_enabled = getattr(self.config.self, "debug", True)
-                logger.info(f"Processing self message with prompt: {prompt[:50]}...")
-                session_memory_config = self.config.session_memory
-
-                # Clear stale self sessions so first message starts fresh
-                try:
-                    reset = self.db.reset_stale_session(
-                        user_jid=session_user,
-                        chat_jid=chat_jid,
-                        stale_after_seconds=self.self_session_stale_seconds
-                    )
-                    if reset:
-                        logger.info(f"Reset stale self session for {chat_jid}")
-                except Exception:
-                    logger.warning("Failed to check/reset stale self session", exc_info=True)
-            else:
-                # Get entity configuration
-                entity = self.config.get_entity_by_jid(chat_jid)
-                if not entity:
-                    logger.warning(f"No active entity config for {chat_jid}, skipping")
-                    # Marking handled by caller
-                    return
+            # IMPORTANT: For self-messages, both user and bot messages have is_from_me=1
+            # We identify bot responses by their message ID pattern (starts with "sent_")
+            if msg_id.startswith("sent_"):
+                logger.info(f"Skipping bot-sent self message {msg_id}")
+                # Marking handled by caller
+                return
 
-                prompt = entity.prompt
-                persona = entity.persona
-                debug_enabled = getattr(entity, "debug", False)
-                prompt = self._resolve_prompt(
-                    prompt_value=prompt,
-                    prompt_is_file=getattr(entity, "prompt_is_file", False)
-                )
-                session_memory_config = self._get_session_memory_config(chat_jid)
-
-                # === WAKE WORD CHECK ===
-                # Skip wake word check for self messages (messages to yourself)
-                if hasattr(entity, 'hey_bot') and entity.hey_bot:
-                    has_wake_word, stripped_content = self.check_and_strip_wake_word(content)
-
-                    if not has_wake_word:
-                        logger.info(f"[BOT-IGNORE] Message {msg_id} from {chat_jid} - no wake word detected")
-                        # Return without processing (silent filter)
-                        # Caller will mark as completed
-                        return
-
-                    # Use stripped content for LLM
-                    content = stripped_content
-
-                    # Validate content is not empty after stripping
-                    if not content or not content.strip():
-                        logger.warning(f"[BOT-IGNORE] Message {msg_id} has empty content after wake word stripping")
-                        # Return without processing
-                        return
-
-                    logger.info(f"[BOT-ACTIVATED] Wake word detected in {msg_id}, stripped to: {content[:50]}...")
-                # === END WAKE WORD CHECK ===
-
-            event_time = self._parse_timestamp(message.get("timestamp"))
-            session_memory_config = session_memory_config or self.config.session_memory
-            response_delay = self.config.get_response_delay_for_entity(chat_jid)
-
-            # Optional wait to let the human reply themselves before bot steps in
-            if not self.config.is_self_message(chat_jid) and response_delay > 0:
-                proceed = await self._maybe_wait_for_user_response(
+            # Use self configuration
+            prompt = self._resolve_prompt(
+                prompt_value=self.config.self.prompt,
+                prompt_is_file=getattr(self.config.self, "prompt_is_file", False)
+            )
+            persona = self.config.self.persona
+            debug_enabled = getattr(self.config.self, "debug", True)
+            logger.info(f"Processing self message with prompt: {prompt[:50]}...")
+            session_memory_config = self.config.session_memory
+
+            # Clear stale self sessions so first message starts fresh
+            try:
+                reset = self.db.reset_stale_session(
+                    user_jid=session_user,
                     chat_jid=chat_jid,
-                    sender=sender,
-                    message_time=event_time,
-                    delay_seconds=response_delay
+                    stale_after_seconds=self.self_session_stale_seconds
                 )
-                if not proceed:
-                    logger.info(f"User responded within {response_delay}s for {msg_id}; skipping bot reply.")
-                    # Marking handled by caller
+                if reset:
+                    logger.info(f"Reset stale self session for {chat_jid}")
+            except Exception:
+                logger.warning("Failed to check/reset stale self session", exc_info=True)
+        else:
+            # Get flattened entity record
+            entity = self._resolved_entities.get(chat_jid)
+            if not entity:
+                logger.warning(f"No active entity config for {chat_jid}, skipping")
+                # Marking handled by caller
+                return
+
+            # File-backed prompts are resolved per message (one os.stat;
+            # the mtime-keyed cache makes unchanged files free) so prompt
+            # edits apply without touching app.json
+            prompt = self._resolve_prompt(
+                prompt_value=entity.prompt_value,
+                prompt_is_file=entity.prompt_is_file
+            )
+            persona = entity.persona
+            debug_enabled = entity.debug
+            session_memory_config = entity.session_memory
+
+            # === WAKE WORD CHECK ===
+            # Skip wake word check for self messages (messages to yourself)
+            if entity.hey_bot:
+                has_wake_word, stripped_content = self.check_and_strip_wake_word(content)
+
+                if not has_wake_word:
+                    logger.info(f"[BOT-IGNORE] Message {msg_id} from {chat_jid} - no wake word detected")
+                    # Return without processing (silent filter)
+                    # Caller will mark as completed
                     return
 
-            # Load and prune context based on per-entity session memory
-            session = self.db.get_or_create_session(
-                user_jid=session_user,
+                # Use stripped content for LLM
+                content = stripped_content
+
+                # Validate content is not empty after stripping
+                if not content or not content.strip():
+                    logger.warning(f"[BOT-IGNORE] Message {msg_id} has empty content after wake word stripping")
+                    # Return without processing
+                    return
+
+                logger.info(f"[BOT-ACTIVATED] Wake word detected in {msg_id}, stripped to: {content[:50]}...")
+            # === END WAKE WORD CHECK ===
+
+        event_time = self._parse_timestamp(message.get("timestamp"))
+        session_memory_config = session_memory_config or self.config.session_memory
+        if self._is_self(chat_jid):
+            response_delay = 0
+        else:
+            response_delay = entity.response_delay
+
+        # Optional wait to let the human reply themselves before bot steps in
+        if not self._is_self(chat_jid) and response_delay > 0:
+            proceed = await self._maybe_wait_for_user_response(
                 chat_jid=chat_jid,
-                session_memory_config=session_memory_config,
-                aliases=None,
-                current_time=event_time
+                sender=sender,
+                message_time=event_time,
+                delay_seconds=response_delay
             )
-            context = self.db.get_session_context(session["session_id"])
-            context = self._prune_context(context, session_memory_config, event_time)
+            if not proceed:
+                logger.info(f"User responded within {response_delay}s for {msg_id}; skipping bot reply.")
+                # Marking handled by caller
+                return
+
+        # Load and prune context based on per-entity session memory
+        session = self.db.get_or_create_session(
+            user_jid=session_user,
+            chat_jid=chat_jid,
+            session_memory_config=session_memory_config,
+            aliases=None,
+            current_time=event_time
+        )
+        context = self.db.get_session_context(session["session_id"])
+        context = self._prune_context(context, session_memory_config, event_time)
+
+        # For debug-enabled chats, dispatch debug info in the background so
+        # the LLM query isn't blocked by a WhatsApp round-trip. The text
+        # rendering of context is only needed for this dump - the LLM
+        # receives context as proper conversation turns.
+        debug_task = None
+        if debug_enabled:
             context_text = self._format_context_for_prompt(context)
-            augmented_prompt = self._augment_prompt_with_context(prompt, context_text)
-
-            # For debug-enabled chats, send debug info BEFORE querying LLM
-            if debug_enabled:
-                try:
-                    debug_message = (
-                        "** DEBUG INFO **\n"
-                        f"[User Entry]: {content}\n"
-                        f"[Prompt]: {augmented_prompt}\n"
-                        f"[Persona]: {persona}\n"
-                        f"[Context]:\n{context_text or 'None'}"
-                    )
-                    logger.info(f"📤 About to send debug info for message {msg_id} to {chat_jid}")
-                    await self.whatsapp.send_message(chat_jid, debug_message)
-                    logger.info(f"✅ Successfully sent debug info for message {msg_id}")
-                except Exception as e:
-                    logger.error(f"❌ Failed to send debug info for {msg_id}: {e}", exc_info=True)
-                    # Continue processing even if debug send fails
-
-            # Query LLM with augmented prompt and sender info
-            response = await self.query_llm(
-                prompt=augmented_prompt,
-                context=context,
-                message=content,
-                sender=sender
+            debug_message = (
+                "** DEBUG INFO **\n"
+                f"[User Entry]: {content}\n"
+                f"[Prompt]: {prompt}\n"
+                f"[Persona]: {persona}\n"
+                f"[Context]:\n{context_text or 'None'}"
+            )
+            logger.info(f"📤 Dispatching debug info for message {msg_id} to {chat_jid}")
+            debug_task = asyncio.create_task(self.whatsapp.send_message(chat_jid, debug_message))
+            self._debug_tasks.add(debug_task)
+            debug_task.add_done_callback(self._debug_tasks.discard)
+            # The callback also consumes the task's exception, so a failed
+            # debug send is logged here even when query_llm or the response
+            # send raises before the join below is reached
+            debug_task.add_done_callback(
+                functools.partial(self._on_debug_send_done, msg_id)
             )
 
-            # Send response
-            await self.whatsapp.send_message(chat_jid, response)
-            # Track last bot response for loop avoidance
-            self.last_bot_response[chat_jid] = response
-
-            # Persist updated context (user + assistant)
-            response_time = datetime.now(timezone.utc)
-            updated_context = self._append_and_trim_context(
-                context=context,
-                user_message=content,
-                assistant_message=response,
-                user_time=event_time,
-                response_time=response_time,
+        # Query LLM with the stable system prompt and sender info
+        response = await self.query_llm(
+            prompt=prompt,
+            context=context,
+            message=content,
+            sender=sender,
+            chat_jid=chat_jid,
+            use_cache=not debug_enabled
+        )
+
+        # Send response
+        await self.whatsapp.send_message(chat_jid, response)
+        # Track last bot response for loop avoidance
+        self._remember_bot_response(chat_jid, response)
+
+        # Join the racing debug send; its outcome is logged by the done
+        # callback, and a debug failure must not fail the message
+        if debug_task is not None:
+            await asyncio.wait([debug_task])
+
+        # Persist updated context (user + assistant)
+        response_time = datetime.now(timezone.utc)
+        updated_context = self._append_and_trim_context(
+            context=context,
+            user_message=content,
+            assistant_message=response,
+            user_time=event_time,
+            response_time=response_time,
+            session_memory_config=session_memory_config,
+            sender=sender
+        )
+        try:
+            self.db.update_session_context(
+                session_id=session["session_id"],
+                context=updated_context,
                 session_memory_config=session_memory_config,
-                sender=sender
+                activity_time=response_time
             )
-            try:
-                self.db.update_session_context(
-                    session_id=session["session_id"],
-                    context=updated_context,
-                    session_memory_config=session_memory_config,
-                    activity_time=response_time
-                )
-            except Exception:
-                logger.warning("Failed to update session context", exc_info=True)
-
-            logger.info(f"✅ Processed message {msg_id}")
+        except Exception:
+            logger.warning("Failed to update session context", exc_info=True)
 
-        except Exception as e:
-            logger.error(f"Error processing message {message.get('id')}: {e}", exc_info=True)
-            # Re-raise to let caller handle marking as failed
-            raise
+        logger.info(f"✅ Processed message {msg_id}")
 
-    async def query_llm(self, prompt: str, context: List[Dict], message: str, sender: str = None) -> str:
+    async def query_llm(self, prompt: str, context: List[Dict], message: str,
+                        sender: str = None, chat_jid: str = None,
+                        use_cache: bool = True) -> str:
         """
         Query Perplexity API with message and context
 
         Args:
             message: User's message
             context: Previous conversation context (user/assistant turns)
-            prompt: System prompt (already augmented with context summary)
+            prompt: System prompt (kept byte-stable across turns)
             sender: Sender's phone number/JID (for context)
+            chat_jid: Chat the reply is for (scopes the response cache)
+            use_cache: Allow serving a cached response (disabled for debug chats)
 
         Returns:
             AI response text
         """
         try:
-            # Build messages array for API - prompt is already augmented with context summary
-            # Context is included as text in the system prompt, not as separate messages
-            messages = [{"role": "system", "content": prompt}]
-
             # Validate user message is not empty
             if not message or not message.strip():
                 logger.error("Cannot send empty message to LLM")
                 return "Please provide a message with content after the wake word."
 
             # Format user message with sender information for better context
-            if sender:
-                # Include sender phone/JID in the message for LLM context
-                user_message_with_context = f"[Message from: {sender}]\n{message}"
-            else:
-                user_message_with_context = message
-
-            # Add the current user message
-            messages.append({"role": "user", "content": user_message_with_context})
+            user_message_with_context = format_user_message(message, sender)
+
+            # Build messages array with a stable prefix: frozen system prompt,
+            # then history as real turns, then the current user message
+            messages = self._build_llm_messages(prompt, context, user_message_with_context)
+
+            # Check response cache before paying for a remote round-trip.
+            # Scoped to the chat so personalized replies never cross chats.
+            prompt_sha = None
+            if use_cache and self.response_cache and chat_jid:
+                prompt_sha = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+                cached = self.response_cache.get(prompt_sha, chat_jid, message)
+                if cached is not None:
+                    logger.info("✅ Response cache hit, skipping Perplexity call")
+                    return cached
 
             logger.info(f"Querying Perplexity with {len(messages)} messages (context in system prompt: {len(context)} entries)")
             logger.debug(f"System prompt: {prompt[:200]}...")
 
-            # Call Perplexity API
-            response = await self.perplexity.chat_completion(messages)
+            # Call Perplexity API (bounded concurrency across parallel chats).
+            # With streaming enabled, chunks are consumed as they arrive so the
+            # response is ready at last-token time instead of full-body time;
+            # the reply still goes out as a single WhatsApp message.
+            async with self._llm_semaphore:
+                if getattr(self.config.perplexity, "stream", False):
+                    chunks = []
+                    async for chunk in self.perplexity.chat_completion_stream(messages):
+                        chunks.append(chunk)
+                    response = "".join(chunks)
+                else:
+                    response = await self.perplexity.chat_completion(messages)
 
             logger.info(f"✅ Received response from Perplexity: {response[:100]}...")
 
+            if prompt_sha:
+                self.response_cache.put(prompt_sha, chat_jid, message, response)
+
             return response
 
         except Exception as e:
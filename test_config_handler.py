@@ -3,19 +3,36 @@
 Test configuration handler basic functionality
 """
 
+# (input, expected) tables at module level so the checks are data-driven
+# and a pytest parametrize can reuse them as-is
+TRIGGER_CASES = [
+    ('bot config', True),
+    ('bot-config', True),
+    ('bot_config', True),
+    ('BOT CONFIG', True),
+    ('  bot config  ', True),
+    ('hello', False),
+    ('', False),
+    ('config', False),
+]
+
+EXIT_CASES = [
+    ('0', True),
+    ('exit', True),
+    ('EXIT', True),
+    ('  exit  ', True),
+    ('1', False),
+    ('quit', False),
+    ('', False),
+]
+
 def test_trigger_detection():
     """Test trigger word detection"""
     from config_handler import ConfigurationHandler
 
     print("Testing trigger detection...")
-    assert ConfigurationHandler.is_config_trigger('bot config') == True
-    assert ConfigurationHandler.is_config_trigger('bot-config') == True
-    assert ConfigurationHandler.is_config_trigger('bot_config') == True
-    assert ConfigurationHandler.is_config_trigger('BOT CONFIG') == True
-    assert ConfigurationHandler.is_config_trigger('  bot config  ') == True
-    assert ConfigurationHandler.is_config_trigger('hello') == False
-    assert ConfigurationHandler.is_config_trigger('') == False
-    assert ConfigurationHandler.is_config_trigger('config') == False
+    for message, expected in TRIGGER_CASES:
+        assert ConfigurationHandler.is_config_trigger(message) == expected, message
     print("✅ Trigger detection works")
 
 def test_exit_detection():
@@ -23,13 +40,8 @@ def test_exit_detection():
     from config_handler import ConfigurationHandler
 
     print("Testing exit detection...")
-    assert ConfigurationHandler.is_exit_command('0') == True
-    assert ConfigurationHandler.is_exit_command('exit') == True
-    assert ConfigurationHandler.is_exit_command('EXIT') == True
-    assert ConfigurationHandler.is_exit_command('  exit  ') == True
-    assert ConfigurationHandler.is_exit_command('1') == False
-    assert ConfigurationHandler.is_exit_command('quit') == False
-    assert ConfigurationHandler.is_exit_command('') == False
+    for message, expected in EXIT_CASES:
+        assert ConfigurationHandler.is_exit_command(message) == expected, message
     print("✅ Exit detection works")
 
 if __name__ == "__main__":
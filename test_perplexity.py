@@ -11,9 +11,12 @@ Usage:
 import asyncio
 import sys
 import os
+from pathlib import Path
 
-# Ensure we're in the right directory
-os.chdir(os.path.dirname(os.path.abspath(__file__)))
+# Ensure we're in the right directory (skip the chdir when already there)
+_HERE = Path(__file__).parent
+if Path.cwd() != _HERE.resolve():
+    os.chdir(_HERE)
 
 # Check if running in venv
 if not hasattr(sys, 'real_prefix') and not (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
@@ -26,6 +29,51 @@ from config import get_config
 from message_agent import PerplexityClient
 
 
+async def _test_simple(client):
+    """Test 1: Simple greeting"""
+    messages = [
+        {"role": "system", "content": "You are a helpful assistant. Respond concisely."},
+        {"role": "user", "content": "Say hello in one sentence."}
+    ]
+
+    response = await client.chat_completion(messages)
+    return [
+        f"📤 Sent: {messages[-1]['content']}",
+        f"📥 Response: {response}"
+    ]
+
+
+async def _test_context(client):
+    """Test 2: Context-aware conversation"""
+    messages = [
+        {"role": "system", "content": "You are a personal assistant."},
+        {"role": "user", "content": "My name is Oded"},
+        {"role": "assistant", "content": "Nice to meet you, Oded!"},
+        {"role": "user", "content": "What's my name?"}
+    ]
+
+    response = await client.chat_completion(messages)
+    return [
+        f"📤 Sent: {messages[-1]['content']}",
+        "   (with context of previous messages)",
+        f"📥 Response: {response}"
+    ]
+
+
+async def _test_empty(client):
+    """Test 3: Empty message (should fail gracefully)"""
+    messages = [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {"role": "user", "content": ""}
+    ]
+
+    try:
+        response = await client.chat_completion(messages)
+        return ["📤 Sent: (empty string)", f"📥 Response: {response}"]
+    except Exception as e:
+        return ["📤 Sent: (empty string)", f"❌ Expected error: {e}"]
+
+
 async def test_perplexity():
     """Test Perplexity API with a simple query"""
     print("=" * 60)
@@ -42,61 +90,37 @@ async def test_perplexity():
         print(f"  Max Tokens: {config.perplexity.max_tokens}")
         print(f"  API Key: {config.perplexity_api_key[:10]}...{config.perplexity_api_key[-4:]}")
 
-        # Initialize Perplexity client
-        client = PerplexityClient(
+        # Run the three independent tests concurrently over the client's
+        # shared connection pool - wall time is max(latency), not the sum
+        async with PerplexityClient(
             api_key=config.perplexity_api_key,
             model=config.perplexity.model,
             temperature=config.perplexity.temperature,
             max_tokens=config.perplexity.max_tokens
-        )
-
-        # Test 1: Simple query
-        print("\n" + "=" * 60)
-        print("Test 1: Simple greeting")
-        print("=" * 60)
-
-        messages = [
-            {"role": "system", "content": "You are a helpful assistant. Respond concisely."},
-            {"role": "user", "content": "Say hello in one sentence."}
-        ]
-
-        print(f"\n📤 Sending: {messages[-1]['content']}")
-        response = await client.chat_completion(messages)
-        print(f"📥 Response: {response}")
-
-        # Test 2: Context-aware query
-        print("\n" + "=" * 60)
-        print("Test 2: Context-aware conversation")
-        print("=" * 60)
-
-        messages = [
-            {"role": "system", "content": "You are a personal assistant."},
-            {"role": "user", "content": "My name is Oded"},
-            {"role": "assistant", "content": "Nice to meet you, Oded!"},
-            {"role": "user", "content": "What's my name?"}
-        ]
-
-        print(f"\n📤 Sending: {messages[-1]['content']}")
-        print(f"   (with context of previous messages)")
-        response = await client.chat_completion(messages)
-        print(f"📥 Response: {response}")
-
-        # Test 3: Empty message (should fail gracefully)
-        print("\n" + "=" * 60)
-        print("Test 3: Empty message (should fail)")
-        print("=" * 60)
-
-        messages = [
-            {"role": "system", "content": "You are a helpful assistant."},
-            {"role": "user", "content": ""}
-        ]
-
-        print(f"\n📤 Sending: (empty string)")
-        try:
-            response = await client.chat_completion(messages)
-            print(f"📥 Response: {response}")
-        except Exception as e:
-            print(f"❌ Expected error: {e}")
+        ) as client:
+            tests = [
+                ("Test 1: Simple greeting", _test_simple(client)),
+                ("Test 2: Context-aware conversation", _test_context(client)),
+                ("Test 3: Empty message (should fail)", _test_empty(client)),
+            ]
+            results = await asyncio.gather(
+                *(coro for _, coro in tests), return_exceptions=True
+            )
+
+        failed = False
+        for (title, _), result in zip(tests, results):
+            print("\n" + "=" * 60)
+            print(title)
+            print("=" * 60)
+            if isinstance(result, BaseException):
+                print(f"❌ Error: {result}")
+                failed = True
+            else:
+                for line in result:
+                    print(line)
+
+        if failed:
+            return False
 
         print("\n" + "=" * 60)
         print("✅ All tests completed!")
@@ -112,5 +136,12 @@ async def test_perplexity():
 
 
 if __name__ == "__main__":
+    # Optional: libuv event loop for faster network round-trips
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     success = asyncio.run(test_perplexity())
     sys.exit(0 if success else 1)
@@ -3,21 +3,11 @@
 Test to demonstrate sender context feature
 """
 
-def test_sender_formatting():
-    """Test how sender information is formatted in messages"""
+from message_agent import format_user_message, format_context_entry
 
-    # Simulate the formatting logic
-    def format_user_message(message: str, sender: str = None) -> str:
-        """Format user message with sender context"""
-        if sender:
-            return f"[Message from: {sender}]\n{message}"
-        return message
 
-    def format_context_entry(message: str, sender: str = None) -> str:
-        """Format context entry with sender"""
-        if sender:
-            return f"[From: {sender}] {message}"
-        return message
+def test_sender_formatting():
+    """Test how sender information is formatted in messages"""
 
     # Test cases
     print("Testing sender context formatting:\n")
@@ -5,44 +5,45 @@ Quick test for wake word detection functionality
 
 from message_agent import MessageAgent
 
-def test_wake_word_detection():
-    """Test wake word detection"""
+# (input, expected_has_wake, expected_stripped)
+# Module-level so a pytest parametrize can reuse the table as-is
+CASES = [
+    # English variations
+    ("hey bot what time is it", True, "what time is it"),
+    ("HEY BOT hello", True, "hello"),
+    ("Hey Bot test", True, "test"),
+    ("hello bot how are you", True, "how are you"),
+    ("HELLO BOT test", True, "test"),
+    ("hi bot what's up", True, "what's up"),
+    ("Hi Bot!", True, "!"),
 
-    print("Testing wake word detection...\n")
+    # Hebrew variations
+    ("הי בוט מה השעה", True, "מה השעה"),
+    ("היי בוט ספר לי על חברת דלתא גליל", True, "ספר לי על חברת דלתא גליל"),
+    ("הלו בוט שלום", True, "שלום"),
 
-    test_cases = [
-        # (input, expected_has_wake, expected_stripped)
-        # English variations
-        ("hey bot what time is it", True, "what time is it"),
-        ("HEY BOT hello", True, "hello"),
-        ("Hey Bot test", True, "test"),
-        ("hello bot how are you", True, "how are you"),
-        ("HELLO BOT test", True, "test"),
-        ("hi bot what's up", True, "what's up"),
-        ("Hi Bot!", True, "!"),
+    # Non-wake word messages
+    ("hello everyone", False, "hello everyone"),
+    ("", False, ""),
+    ("היי", False, "היי"),
+    ("I said hey bot yesterday", False, "I said hey bot yesterday"),
 
-        # Hebrew variations
-        ("הי בוט מה השעה", True, "מה השעה"),
-        ("היי בוט ספר לי על חברת דלתא גליל", True, "ספר לי על חברת דלתא גליל"),
-        ("הלו בוט שלום", True, "שלום"),
+    # Edge cases
+    ("hey bot", True, ""),
+    ("hey bot   test", True, "test"),
+    ("Hey bot, what time is it?", True, ", what time is it?"),
+    ("hello bot", True, ""),
+]
 
-        # Non-wake word messages
-        ("hello everyone", False, "hello everyone"),
-        ("", False, ""),
-        ("היי", False, "היי"),
-        ("I said hey bot yesterday", False, "I said hey bot yesterday"),
+def test_wake_word_detection():
+    """Test wake word detection"""
 
-        # Edge cases
-        ("hey bot", True, ""),
-        ("hey bot   test", True, "test"),
-        ("Hey bot, what time is it?", True, ", what time is it?"),
-        ("hello bot", True, ""),
-    ]
+    print("Testing wake word detection...\n")
 
     passed = 0
     failed = 0
 
-    for content, expected_has_wake, expected_stripped in test_cases:
+    for content, expected_has_wake, expected_stripped in CASES:
         has_wake, stripped = MessageAgent.check_and_strip_wake_word(content)
 
         if has_wake == expected_has_wake and stripped == expected_stripped:
@@ -4,17 +4,27 @@ Vitality Checker Module
 Schedules and sends daily health check messages to confirm the service is operational.
 """
 
+import asyncio
 import logging
-from datetime import datetime
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
+from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
 
+def _fmt_ts(dt: datetime) -> str:
+    """Format a datetime as 'YYYY-MM-DD HH:MM:SS' without strftime's locale lookup"""
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    )
+
+
 class VitalityChecker:
     """Daily health check scheduler"""
 
+    __slots__ = ('config', 'whatsapp', '_task', 'is_running',
+                 '_my_jid', '_message_prefix')
+
     def __init__(self, config, whatsapp_client):
         """
         Initialize vitality checker
@@ -25,9 +35,13 @@ class VitalityChecker:
         """
         self.config = config
         self.whatsapp = whatsapp_client
-        self.scheduler = AsyncIOScheduler()
+        self._task = None
         self.is_running = False
 
+        # Static parts of the daily message computed once instead of per tick
+        self._my_jid = f"{config.whatsapp.phone_number}@s.whatsapp.net"
+        self._message_prefix = f"{config.vitality.message}\n"
+
     def start(self):
         """Start the vitality check scheduler"""
         if not self.config.vitality.enabled:
@@ -38,23 +52,9 @@ class VitalityChecker:
             # Parse time (HH:MM format)
             hour, minute = map(int, self.config.vitality.time.split(":"))
 
-            # Create cron trigger
-            trigger = CronTrigger(
-                hour=hour,
-                minute=minute,
-                timezone=self.config.vitality.get_timezone()
-            )
-
-            # Schedule the job
-            self.scheduler.add_job(
-                self.send_vitality_message,
-                trigger=trigger,
-                id="vitality_check",
-                name="Daily Vitality Check",
-                replace_existing=True
-            )
-
-            self.scheduler.start()
+            # Lightweight sleep-until-next-tick loop; one job per day does
+            # not need a full scheduler dependency
+            self._task = asyncio.create_task(self._run_loop(hour, minute))
             self.is_running = True
 
             logger.info(f"✅ Vitality checker started")
@@ -68,24 +68,38 @@ class VitalityChecker:
     def stop(self):
         """Stop the vitality check scheduler"""
         if self.is_running:
-            self.scheduler.shutdown()
+            if self._task:
+                self._task.cancel()
+                self._task = None
             self.is_running = False
             logger.info("Vitality checker stopped")
 
+    async def _run_loop(self, hour: int, minute: int):
+        """Sleep until the next scheduled wall-clock time, send, repeat"""
+        tz = self.config.vitality.get_timezone()
+
+        while True:
+            now = datetime.now(tz)
+            target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if target <= now:
+                target += timedelta(days=1)
+            # pytz timezones need normalize() after arithmetic across DST
+            if hasattr(tz, "normalize"):
+                target = tz.normalize(target)
+
+            await asyncio.sleep((target - now).total_seconds())
+            await self.send_vitality_message()
+
     async def send_vitality_message(self):
         """Send daily health check message to self"""
         try:
             logger.info("Sending daily vitality check message...")
 
-            # Get own JID
-            my_jid = f"{self.config.whatsapp.phone_number}@s.whatsapp.net"
-
-            # Prepare message
-            message = f"{self.config.vitality.message}\n"
-            message += f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            # Only the timestamp varies per tick
+            message = self._message_prefix + f"Timestamp: {_fmt_ts(datetime.now())}"
 
             # Send via WhatsApp
-            await self.whatsapp.send_message(my_jid, message)
+            await self.whatsapp.send_message(self._my_jid, message)
 
             logger.info("✅ Vitality check message sent")
 
@@ -102,6 +116,13 @@ if __name__ == "__main__":
 
     logging.basicConfig(level=logging.INFO)
 
+    # Optional: libuv event loop for faster network round-trips
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     async def test():
         try:
             config = get_config()
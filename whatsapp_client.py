@@ -37,6 +37,22 @@ class WhatsAppClient:
         self.bridge_url = "http://localhost:8080"
         self.bridge_process = None
 
+        # Pooled HTTP client so every send reuses the bridge connection
+        # instead of opening a fresh one per call
+        self._http = httpx.AsyncClient(
+            base_url=self.bridge_url,
+            limits=httpx.Limits(max_keepalive_connections=10)
+        )
+
+        # Set by disconnect() so idle loops wake immediately instead of
+        # timing out of a sleep
+        self._stop = asyncio.Event()
+
+        # Write-behind queue for sent-message rows: batches share one SQLite
+        # commit instead of paying an fsync per send
+        self._write_q = asyncio.Queue()
+        self._writer_task = None
+
 
     async def connect(self, force_qr: bool = False):
         """
@@ -53,6 +69,9 @@ class WhatsAppClient:
         logger.info("✅ Connected to WhatsApp via Go bridge")
         self.is_connected = True
 
+        # Start the write-behind consumer for sent-message persistence
+        self._writer_task = asyncio.create_task(self._db_writer())
+
     async def _start_bridge(self, force_reset: bool = False):
         """Start the Go bridge process"""
         import os
@@ -84,15 +103,16 @@ class WhatsAppClient:
         logger.info("Waiting for Go bridge to be ready...")
 
         start_time = asyncio.get_event_loop().time()
+        delay = 0.05
 
         while True:
             try:
-                async with httpx.AsyncClient() as client:
-                    # Try a simple connection test
-                    response = await client.get(f"{self.bridge_url}/api/send", timeout=2.0)
-                    # Any response (even error) means the server is up
-                    logger.info("✅ Go bridge is reachable")
-                    return
+                # Probe over the pooled client so the first real send reuses
+                # the connection the probe opened
+                response = await self._http.get("/api/send", timeout=2.0)
+                # Any response (even error) means the server is up
+                logger.info("✅ Go bridge is reachable")
+                return
             except (httpx.ConnectError, httpx.TimeoutException):
                 # Bridge not ready yet
                 elapsed = asyncio.get_event_loop().time() - start_time
@@ -102,7 +122,10 @@ class WhatsAppClient:
                         "Please start the Go bridge first:\n"
                         "  cd whatsapp-bridge && ./whatsapp-client"
                     )
-                await asyncio.sleep(1)
+                # Exponential backoff: an already-running bridge is detected
+                # within ~50ms instead of a fixed 1s wait
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 1.0)
 
     async def _check_authentication(self) -> bool:
         """
@@ -126,42 +149,82 @@ class WhatsAppClient:
             raise RuntimeError("Not connected to WhatsApp")
 
         try:
-            logger.info(f"📤 Sending message to {chat_jid} (len={len(content)})")
-
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.bridge_url}/api/send",
-                    json={
-                        "recipient": chat_jid,
-                        "message": content
-                    },
-                    timeout=30.0
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    if result.get("success"):
-                        logger.info("✅ Message sent successfully")
-
-                        # Store sent message in database
-                        msg_id = f"sent_{int(datetime.now().timestamp())}"
-                        self.db.insert_message(
-                            msg_id=msg_id,
-                            chat_jid=chat_jid,
-                            sender=f"{self.phone_number}@s.whatsapp.net",
-                            content=content,
-                            timestamp=datetime.now(),
-                            is_from_me=True
-                        )
-                    else:
-                        logger.error(f"Failed to send message: {result.get('message')}")
+            logger.info("📤 Sending message to %s (len=%d)", chat_jid, len(content))
+
+            response = await self._http.post(
+                "/api/send",
+                json={
+                    "recipient": chat_jid,
+                    "message": content
+                },
+                timeout=30.0
+            )
+
+            if response.status_code == 200:
+                result = response.json()
+                if result.get("success"):
+                    logger.info("✅ Message sent successfully")
+
+                    # Queue sent message for batched persistence; the writer
+                    # task commits bursts of sends with one fsync
+                    now = datetime.now()
+                    msg_id = f"sent_{int(now.timestamp())}"
+                    self._write_q.put_nowait((
+                        msg_id,
+                        chat_jid,
+                        f"{self.phone_number}@s.whatsapp.net",
+                        content,
+                        now,
+                        True
+                    ))
                 else:
-                    logger.error(f"HTTP error {response.status_code}: {response.text}")
+                    logger.error("Failed to send message: %s", result.get("message"))
+            else:
+                logger.error("HTTP error %s: %s", response.status_code, response.text)
 
         except Exception as e:
-            logger.error(f"Error sending message: {e}", exc_info=True)
+            logger.error("Error sending message: %s", e, exc_info=True)
             raise
 
+    async def send_many(self, chat_jid: str, contents: list):
+        """
+        Send several messages to a chat concurrently over the pooled connection
+
+        Args:
+            chat_jid: Recipient JID (group or user)
+            contents: Message texts to dispatch
+        """
+        await asyncio.gather(*(self.send_message(chat_jid, content) for content in contents))
+
+    async def _db_writer(self):
+        """Drain queued sent-message rows into SQLite in batches"""
+        while True:
+            row = await self._write_q.get()
+            done = row is None
+            batch = [] if done else [row]
+
+            # Brief batching window so bursts of sends share one commit
+            while not done and len(batch) < 100:
+                try:
+                    nxt = await asyncio.wait_for(self._write_q.get(), timeout=0.05)
+                except asyncio.TimeoutError:
+                    break
+                if nxt is None:
+                    done = True
+                else:
+                    batch.append(nxt)
+
+            if batch:
+                try:
+                    # check_same_thread=False on the connection makes the
+                    # thread handoff safe
+                    await asyncio.to_thread(self.db.insert_many, batch)
+                except Exception as e:
+                    logger.error(f"Failed to persist sent messages: {e}", exc_info=True)
+
+            if done:
+                return
+
     async def start_listening(self):
         """
         Start listening for incoming messages from Go bridge
@@ -174,11 +237,10 @@ class WhatsAppClient:
 
         logger.info("Started listening for WhatsApp messages via Go bridge...")
 
-        # For now, the Go bridge handles message receiving and storage
-        # We can poll its database or implement a webhook later
-        # This keeps the service running
-        while self.is_connected:
-            await asyncio.sleep(10)
+        # The Go bridge handles message receiving and storage. Park on the
+        # stop event instead of a wake-every-10s sleep loop; disconnect()
+        # sets it so shutdown is immediate
+        await self._stop.wait()
 
     async def send_startup_validation(self):
         """Send validation message to self confirming service is operational"""
@@ -198,10 +260,24 @@ class WhatsAppClient:
         except Exception as e:
             logger.error(f"Failed to send startup validation: {e}", exc_info=True)
 
-    def disconnect(self):
+    async def disconnect(self):
         """Disconnect from WhatsApp (Go bridge continues running separately)"""
         logger.info("Disconnecting from WhatsApp...")
         self.is_connected = False
+        self._stop.set()
+
+        if self._writer_task:
+            # Sentinel tells the writer to flush pending rows and exit;
+            # await it so every buffered row is committed before the
+            # caller closes the database
+            self._write_q.put_nowait(None)
+            try:
+                await self._writer_task
+            except Exception:
+                logger.warning("Write-behind flush failed on shutdown", exc_info=True)
+            self._writer_task = None
+
+        await self._http.aclose()
         logger.info("✅ Disconnected (Go bridge still running)")
 
 
@@ -215,6 +291,13 @@ if __name__ == "__main__":
 
     logging.basicConfig(level=logging.INFO)
 
+    # Optional: libuv event loop for lower per-message loop overhead
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     async def test():
         try:
             config = get_config()
@@ -229,7 +312,7 @@ if __name__ == "__main__":
             # Keep running
             await asyncio.sleep(5)
 
-            client.disconnect()
+            await client.disconnect()
 
         except Exception as e:
             logger.error(f"❌ Error: {e}", exc_info=True)
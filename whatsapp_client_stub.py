@@ -15,11 +15,13 @@ WhatsApp library integration.
 """
 
 import asyncio
+import io
 import logging
+import os
+import sys
 from datetime import datetime
 from typing import Optional, Callable
 import json
-import qrcode
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +46,12 @@ class WhatsAppClient:
         # Phone number from config
         self.phone_number = config.whatsapp.phone_number
 
+        # Inbound messages are queued here by the library callback and
+        # consumed by a small worker pool, so slow handler work never
+        # blocks the library's event path
+        self._inbox = asyncio.Queue(maxsize=10_000)
+        self._workers = []
+
     async def connect(self, force_qr: bool = False):
         """
         Connect to WhatsApp with QR authentication if needed
@@ -83,6 +91,9 @@ class WhatsAppClient:
 
         TODO: Replace with actual WhatsApp library QR authentication
         """
+        # Deferred import: only the QR auth path pays for qrcode/PIL
+        import qrcode
+
         logger.info("=" * 50)
         logger.info("WHATSAPP QR CODE AUTHENTICATION")
         logger.info("=" * 50)
@@ -90,12 +101,17 @@ class WhatsAppClient:
         # TODO: Replace with actual WhatsApp library code
         # For now, generate a placeholder QR code
         qr_data = f"whatsapp-auth:{self.phone_number}:placeholder"
-        qr = qrcode.QRCode()
+        qr = qrcode.QRCode(border=1)
         qr.add_data(qr_data)
         qr.make()
 
         logger.info("\nScan this QR code with WhatsApp:")
-        qr.print_ascii(invert=True)
+        # Render into a buffer and write once instead of a print per row,
+        # so the QR appears atomically (no interleaving with log output)
+        buf = io.StringIO()
+        qr.print_ascii(out=buf, invert=True)
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
         logger.info("\nWaiting for QR code scan...")
         logger.info("=" * 50)
@@ -158,15 +174,47 @@ class WhatsAppClient:
 
         logger.info("Started listening for WhatsApp messages...")
 
+        # Worker pool draining the inbox concurrently; the library callback
+        # only enqueues (see enqueue_message) so handler latency never
+        # stalls message reception
+        worker_count = os.cpu_count() or 4
+        self._workers = [
+            asyncio.create_task(self._inbox_worker())
+            for _ in range(worker_count)
+        ]
+
         # TODO: Replace with actual WhatsApp library message event subscription
+        # (register enqueue_message as the message callback)
         # For now, this is a placeholder loop
         while self.is_connected:
             await asyncio.sleep(1)
 
-            # TODO: Handle incoming messages from WhatsApp library
-            # When message received, call:
-            # if self.message_handler:
-            #     await self.message_handler(msg_id, chat_jid, sender, content, timestamp)
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+
+    def enqueue_message(self, message):
+        """
+        Synchronous message callback for the WhatsApp library.
+
+        Register this directly as the 'message' event handler: the
+        library's event path then pays a single put_nowait instead of
+        creating and scheduling a coroutine per inbound message. The
+        worker pool picks the message up on the event loop.
+        """
+        try:
+            self._inbox.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning("Inbound queue full, dropping message")
+
+    async def _inbox_worker(self):
+        """Consume queued inbound messages and run the handler"""
+        while True:
+            message = await self._inbox.get()
+            try:
+                await self.on_message(message)
+            except Exception as e:
+                logger.error("Error in inbox worker: %s", e, exc_info=True)
 
     async def on_message(self, message):
         """
@@ -178,19 +226,20 @@ class WhatsAppClient:
         TODO: Adapt to actual WhatsApp library message format
         """
         try:
+            # Filter first: most traffic on busy accounts is unmonitored, so
+            # skip field extraction and timestamp conversion for it entirely
+            chat_jid = message.get("from", "unknown")
+            if not self.config.is_monitored(chat_jid):
+                logger.debug("Ignoring message from non-monitored chat: %s", chat_jid)
+                return
+
             # TODO: Extract from actual WhatsApp library message format
             msg_id = message.get("id", "unknown")
-            chat_jid = message.get("from", "unknown")
             sender = message.get("sender", chat_jid)
             content = message.get("body", "")
             timestamp = datetime.fromtimestamp(message.get("timestamp", 0))
 
-            # Check if monitored entity
-            if not self.config.is_monitored(chat_jid):
-                logger.debug(f"Ignoring message from non-monitored chat: {chat_jid}")
-                return
-
-            logger.info(f"📩 Message from {chat_jid}: {content[:50]}...")
+            logger.info("📩 Message from %s: %s...", chat_jid, content[:50])
 
             # Store in database
             self.db.insert_message(
@@ -202,10 +251,10 @@ class WhatsAppClient:
                 is_from_me=False
             )
 
-            logger.info(f"✅ Message stored in database")
+            logger.info("✅ Message stored in database")
 
         except Exception as e:
-            logger.error(f"Error handling message: {e}", exc_info=True)
+            logger.error("Error handling message: %s", e, exc_info=True)
 
     async def send_message(self, chat_jid: str, content: str):
         """
@@ -221,14 +270,14 @@ class WhatsAppClient:
             raise RuntimeError("Not connected to WhatsApp")
 
         try:
-            logger.info(f"📤 Sending message to {chat_jid}: {content[:50]}...")
+            logger.info("📤 Sending message to %s: %s...", chat_jid, content[:50])
 
             # TODO: Replace with actual WhatsApp library send method
             # Example:
             # await self.client.send_message(chat_jid, content)
 
             # Placeholder: Log only
-            logger.info(f"✅ Message sent (PLACEHOLDER)")
+            logger.info("✅ Message sent (PLACEHOLDER)")
 
             # Store sent message in database
             msg_id = f"sent_{int(datetime.now().timestamp())}"
@@ -242,7 +291,7 @@ class WhatsAppClient:
             )
 
         except Exception as e:
-            logger.error(f"Error sending message: {e}", exc_info=True)
+            logger.error("Error sending message: %s", e, exc_info=True)
             raise
 
     def disconnect(self):
@@ -308,9 +357,8 @@ class WhatsAppClient:
         self.db.save_whatsapp_session(session.to_json())
 
     async def start_listening(self):
-        @self.client.on('message')
-        async def handle_message(msg):
-            await self.on_message(msg)
+        # Sync callback: no coroutine creation on the library's event path
+        self.client.on('message')(self.enqueue_message)
 
         await self.client.listen()
 